@@ -9,70 +9,111 @@ import sys
 import re
 import json
 
+# Precompiled patterns
+_TEMPLATE_RE = re.compile(rb'\{\{.*?\}\}')
+_PASSWORD_RE = re.compile(rb'password:\s*["\']?[^{}\s\'"]+["\']?', re.IGNORECASE)
+
+# Single-byte values: membership tests with an int are much cheaper on bytes
+_TAB = ord('\t')
+_COLON = ord(':')
+
+# Buffered status output, flushed once per section
+_OUT = []
+
 def print_status(status, message):
-    """Print status message"""
+    """Buffer status message"""
     if status == "PASS":
-        print(f"[PASS] {message}")
+        _OUT.append(f"[PASS] {message}\n")
     elif status == "FAIL":
-        print(f"[FAIL] {message}")
+        _OUT.append(f"[FAIL] {message}\n")
     elif status == "WARN":
-        print(f"[WARN] {message}")
+        _OUT.append(f"[WARN] {message}\n")
     else:
-        print(f"[INFO] {message}")
+        _OUT.append(f"[INFO] {message}\n")
+
+def flush_status():
+    """Write buffered status lines to stdout in a single call"""
+    sys.stdout.write(''.join(_OUT))
+    _OUT.clear()
 
 def check_file_exists(file_path):
     """Check if file exists"""
     return os.path.exists(file_path)
 
+def list_chart_entries(chart_dir):
+    """List the chart directory once, keyed by entry name"""
+    with os.scandir(chart_dir) as it:
+        return {entry.name: entry for entry in it}
+
 def read_file_content(file_path):
-    """Read file content safely"""
+    """Read file content safely as bytes"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
+        with open(file_path, 'rb') as file:
             return file.read()
     except Exception as e:
         return None
 
+def _iter_templates(root):
+    """Yield template file paths under root using os.scandir"""
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and entry.name.endswith(('.yaml', '.yml')) and entry.name != 'NOTES.txt':
+                    yield entry.path
+        # Keep os.walk's top-down ordering
+        stack.extend(reversed(subdirs))
+
 def basic_yaml_check(content):
     """Basic YAML syntax check"""
-    lines = content.split('\n')
+    lines = content.split(b'\n')
     issues = []
+    # Most files have no tabs at all; test the whole buffer once
+    has_tabs = _TAB in content
     
     for i, line in enumerate(lines, 1):
         # Skip empty lines and comments
         stripped = line.strip()
-        if not stripped or stripped.startswith('#'):
+        if not stripped or stripped.startswith(b'#'):
             continue
             
         # Check for basic YAML issues
-        if line.startswith(' ') and not line.startswith('  '):
-            if ':' in line:
+        if line.startswith(b' ') and not line.startswith(b'  '):
+            if _COLON in line:
                 issues.append(f"Line {i}: Possible indentation issue (use 2 spaces)")
         
         # Check for tabs
-        if '\t' in line:
+        if has_tabs and _TAB in line:
             issues.append(f"Line {i}: Contains tabs (use spaces instead)")
     
     return issues
 
 def check_helm_template_syntax(content):
     """Check basic Helm template syntax"""
+    # Plain YAML without template delimiters has nothing to check
+    if b'{{' not in content and b'}}' not in content:
+        return []
+    
     issues = []
     
     # Count braces
-    open_braces = content.count('{{')
-    close_braces = content.count('}}')
+    open_braces = content.count(b'{{')
+    close_braces = content.count(b'}}')
     if open_braces != close_braces:
         issues.append(f"Unmatched template braces: {open_braces} opening, {close_braces} closing")
     
     # Check for common template issues
-    lines = content.split('\n')
+    lines = content.split(b'\n')
     for i, line in enumerate(lines, 1):
-        if '{{' in line and '}}' in line:
+        if b'{{' in line and b'}}' in line:
             # Check for basic template syntax
-            template_parts = re.findall(r'\{\{.*?\}\}', line)
+            template_parts = _TEMPLATE_RE.findall(line)
             for template in template_parts:
                 # Check for unclosed quotes
-                if template.count('"') % 2 != 0:
+                if template.count(b'"') % 2 != 0:
                     issues.append(f"Line {i}: Possible unclosed quote in template")
     
     return issues
@@ -81,21 +122,56 @@ def check_security_issues(content, filename):
     """Check for basic security issues"""
     issues = []
     
-    # Check for hardcoded passwords
-    if re.search(r'password:\s*["\']?[^{}\s\'"]+["\']?', content, re.IGNORECASE):
-        if '{{' not in content or '}}' not in content:
+    # Check for hardcoded passwords, skipping the regex when the word never appears
+    if b'password' in content.lower() and _PASSWORD_RE.search(content):
+        if b'{{' not in content or b'}}' not in content:
             issues.append(f"{filename}: Possible hardcoded password")
     
     # Check for privileged containers
-    if 'privileged: true' in content:
+    if b'privileged: true' in content:
         issues.append(f"{filename}: Privileged container found")
     
     # Check for root user
-    if 'runAsUser: 0' in content:
+    if b'runAsUser: 0' in content:
         issues.append(f"{filename}: Container running as root")
     
     return issues
 
+def validate_template_file(template_file):
+    """Validate one template, printing its status lines and returning the issue count"""
+    file_name = os.path.basename(template_file)
+    content = read_file_content(template_file)
+    issue_count = 0
+    
+    if content:
+        # Basic YAML check
+        yaml_issues = basic_yaml_check(content)
+        if not yaml_issues:
+            print_status("PASS", f"{file_name}: Basic YAML syntax OK")
+        else:
+            for issue in yaml_issues:
+                print_status("FAIL", f"{file_name}: {issue}")
+                issue_count += 1
+        
+        # Helm template check
+        template_issues = check_helm_template_syntax(content)
+        if not template_issues:
+            print_status("PASS", f"{file_name}: Template syntax OK")
+        else:
+            for issue in template_issues:
+                print_status("FAIL", f"{file_name}: {issue}")
+                issue_count += 1
+        
+        # Security check
+        security_issues = check_security_issues(content, file_name)
+        for issue in security_issues:
+            print_status("WARN", f"Security: {issue}")
+    else:
+        print_status("FAIL", f"Cannot read {file_name}")
+        issue_count += 1
+    
+    return issue_count
+
 def main():
     """Main validation function"""
     print("=== Simple Helm Chart Validation ===")
@@ -107,22 +183,23 @@ def main():
     print(f"Chart directory: {chart_dir}")
     print()
     
+    entries = list_chart_entries(chart_dir)
+    chart_prefix = chart_dir.rstrip(os.sep) + os.sep
+    
     # Check required files
     print("=== Checking Required Files ===")
     required_files = ['Chart.yaml', 'values.yaml']
     missing_files = []
     
     for file_name in required_files:
-        file_path = os.path.join(chart_dir, file_name)
-        if check_file_exists(file_path):
+        if file_name in entries:
             print_status("PASS", f"{file_name} exists")
         else:
             print_status("FAIL", f"{file_name} missing")
             missing_files.append(file_name)
     
     # Check templates directory
-    templates_dir = os.path.join(chart_dir, 'templates')
-    if check_file_exists(templates_dir):
+    if 'templates' in entries:
         print_status("PASS", "templates directory exists")
     else:
         print_status("FAIL", "templates directory missing")
@@ -130,11 +207,13 @@ def main():
     
     if missing_files:
         print_status("FAIL", f"Missing required files: {', '.join(missing_files)}")
+        flush_status()
         return False
     
     # Validate Chart.yaml
+    flush_status()
     print("\n=== Validating Chart.yaml ===")
-    chart_file = os.path.join(chart_dir, 'Chart.yaml')
+    chart_file = chart_prefix + 'Chart.yaml'
     chart_content = read_file_content(chart_file)
     
     if chart_content:
@@ -148,7 +227,7 @@ def main():
         # Check for required fields
         required_fields = ['apiVersion:', 'name:', 'version:']
         for field in required_fields:
-            if field in chart_content:
+            if field.encode() in chart_content:
                 print_status("PASS", f"Chart.yaml contains {field.rstrip(':')}")
             else:
                 print_status("FAIL", f"Chart.yaml missing {field.rstrip(':')}")
@@ -156,8 +235,9 @@ def main():
         print_status("FAIL", "Cannot read Chart.yaml")
     
     # Validate values.yaml
+    flush_status()
     print("\n=== Validating values.yaml ===")
-    values_file = os.path.join(chart_dir, 'values.yaml')
+    values_file = chart_prefix + 'values.yaml'
     values_content = read_file_content(values_file)
     
     if values_content:
@@ -171,56 +251,25 @@ def main():
         print_status("FAIL", "Cannot read values.yaml")
     
     # Validate template files
+    flush_status()
     print("\n=== Validating Template Files ===")
-    templates_dir = os.path.join(chart_dir, 'templates')
+    templates_dir = chart_prefix + 'templates'
     
     if os.path.exists(templates_dir):
-        template_files = []
-        for root, dirs, files in os.walk(templates_dir):
-            for file in files:
-                if file.endswith(('.yaml', '.yml')) and file != 'NOTES.txt':
-                    template_files.append(os.path.join(root, file))
+        template_files = list(_iter_templates(templates_dir))
         
         print_status("INFO", f"Found {len(template_files)} template files")
         
         total_issues = 0
         for template_file in template_files:
-            file_name = os.path.basename(template_file)
-            content = read_file_content(template_file)
-            
-            if content:
-                # Basic YAML check
-                yaml_issues = basic_yaml_check(content)
-                if not yaml_issues:
-                    print_status("PASS", f"{file_name}: Basic YAML syntax OK")
-                else:
-                    for issue in yaml_issues:
-                        print_status("FAIL", f"{file_name}: {issue}")
-                        total_issues += 1
-                
-                # Helm template check
-                template_issues = check_helm_template_syntax(content)
-                if not template_issues:
-                    print_status("PASS", f"{file_name}: Template syntax OK")
-                else:
-                    for issue in template_issues:
-                        print_status("FAIL", f"{file_name}: {issue}")
-                        total_issues += 1
-                
-                # Security check
-                security_issues = check_security_issues(content, file_name)
-                for issue in security_issues:
-                    print_status("WARN", f"Security: {issue}")
-            else:
-                print_status("FAIL", f"Cannot read {file_name}")
-                total_issues += 1
+            total_issues += validate_template_file(template_file)
     
     # Check for best practices
+    flush_status()
     print("\n=== Best Practices Check ===")
     
     # Check .helmignore
-    helmignore_path = os.path.join(chart_dir, '.helmignore')
-    if check_file_exists(helmignore_path):
+    if '.helmignore' in entries:
         print_status("PASS", ".helmignore exists")
     else:
         print_status("WARN", ".helmignore not found")
@@ -229,7 +278,7 @@ def main():
     readme_files = ['README.md', 'README.txt', 'README']
     readme_found = False
     for readme in readme_files:
-        if check_file_exists(os.path.join(chart_dir, readme)):
+        if readme in entries:
             print_status("PASS", f"{readme} exists")
             readme_found = True
             break
@@ -238,24 +287,26 @@ def main():
         print_status("WARN", "No README file found")
     
     # Check NOTES.txt
-    notes_path = os.path.join(chart_dir, 'templates', 'NOTES.txt')
+    notes_path = templates_dir + os.sep + 'NOTES.txt'
     if check_file_exists(notes_path):
         print_status("PASS", "NOTES.txt exists")
     else:
-        notes_path = os.path.join(chart_dir, 'NOTES.txt')
-        if check_file_exists(notes_path):
+        if 'NOTES.txt' in entries:
             print_status("PASS", "NOTES.txt exists")
         else:
             print_status("WARN", "NOTES.txt not found")
     
+    flush_status()
     print("\n=== Validation Summary ===")
     
     if 'total_issues' in locals() and total_issues > 0:
         print_status("FAIL", f"Found {total_issues} issues")
+        flush_status()
         print("\n❌ Validation completed with issues!")
         return False
     else:
         print_status("PASS", "Basic validation passed")
+        flush_status()
         print("\n✅ Basic validation completed successfully!")
         return True
 
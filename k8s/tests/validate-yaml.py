@@ -4,13 +4,24 @@ YAML Validation Script for secure-api-system Helm Chart
 This script validates YAML syntax and basic structure of Helm templates
 """
 
+import argparse
 import os
 import sys
 import yaml
-import glob
 import re
+from functools import lru_cache
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Precompiled patterns
+_PASSWORD_RE = re.compile(r'password:\s*["\']?[^{}\s]+["\']?', re.IGNORECASE)
+_TOP_LEVEL_KEY_RE = re.compile(rb'^([A-Za-z_][\w-]*):', re.MULTILINE)
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -19,33 +30,62 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+# Buffered status output, flushed once per section
+_OUT = []
+
 def print_status(status, message):
-    """Print status message with color"""
+    """Buffer status message with color"""
     if status == "PASS":
-        print(f"{Colors.GREEN}[PASS]{Colors.NC} {message}")
+        _OUT.append(f"{Colors.GREEN}[PASS]{Colors.NC} {message}\n")
     elif status == "FAIL":
-        print(f"{Colors.RED}[FAIL]{Colors.NC} {message}")
+        _OUT.append(f"{Colors.RED}[FAIL]{Colors.NC} {message}\n")
     elif status == "WARN":
-        print(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}")
+        _OUT.append(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}\n")
     else:
-        print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
+        _OUT.append(f"{Colors.BLUE}[INFO]{Colors.NC} {message}\n")
+
+def flush_status():
+    """Write buffered status lines to stdout in a single call"""
+    sys.stdout.write(''.join(_OUT))
+    _OUT.clear()
+
+@lru_cache(maxsize=None)
+def _read(file_path):
+    """Read a file once and cache its text"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+def _load_yaml(file_path):
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(file_path, 'rb') as file:
+        return yaml.load(file, Loader=SafeLoader)
 
 def validate_yaml_syntax(file_path):
     """Validate YAML syntax of a file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            yaml.safe_load(file)
+        _load_yaml(file_path)
         return True, None
     except yaml.YAMLError as e:
         return False, str(e)
     except Exception as e:
         return False, str(e)
 
+def is_helm_template(file_path):
+    """Check whether a file contains Helm template expressions"""
+    try:
+        return '{{' in _read(file_path)
+    except Exception:
+        # Let the YAML parser report unreadable files
+        return False
+
 def validate_helm_template_syntax(file_path):
     """Basic validation of Helm template syntax"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = _read(file_path)
+        
+        # Plain YAML without template delimiters has nothing to check
+        if '{{' not in content and '}}' not in content:
+            return True, []
         
         # Check for common Helm template issues
         issues = []
@@ -75,7 +115,12 @@ def validate_helm_template_syntax(file_path):
     except Exception as e:
         return False, [str(e)]
 
-def check_required_files(chart_dir):
+def list_chart_entries(chart_dir):
+    """List the chart directory once, keyed by entry name"""
+    with os.scandir(chart_dir) as it:
+        return {entry.name: entry for entry in it}
+
+def check_required_files(entries):
     """Check if required Helm chart files exist"""
     required_files = [
         'Chart.yaml',
@@ -85,8 +130,7 @@ def check_required_files(chart_dir):
     
     missing_files = []
     for file_name in required_files:
-        file_path = os.path.join(chart_dir, file_name)
-        if not os.path.exists(file_path):
+        if file_name not in entries:
             missing_files.append(file_name)
     
     return len(missing_files) == 0, missing_files
@@ -96,8 +140,7 @@ def validate_chart_yaml(chart_dir):
     chart_file = os.path.join(chart_dir, 'Chart.yaml')
     
     try:
-        with open(chart_file, 'r', encoding='utf-8') as file:
-            chart_data = yaml.safe_load(file)
+        chart_data = _load_yaml(chart_file)
         
         required_fields = ['apiVersion', 'name', 'version']
         missing_fields = []
@@ -114,65 +157,121 @@ def validate_chart_yaml(chart_dir):
     except Exception as e:
         return False, [str(e)], None
 
-def validate_values_yaml(chart_dir):
-    """Validate values.yaml structure"""
+def validate_values_yaml(chart_dir, shallow=False):
+    """Validate values.yaml structure, returning the number of top-level sections"""
     values_file = os.path.join(chart_dir, 'values.yaml')
     
     try:
-        with open(values_file, 'r', encoding='utf-8') as file:
-            values_data = yaml.safe_load(file)
+        if not shallow:
+            values_data = _load_yaml(values_file)
+            
+            # Basic structure validation
+            if not isinstance(values_data, dict):
+                return False, ["values.yaml should contain a dictionary"], None
+            
+            return True, [], len(values_data)
         
-        # Basic structure validation
-        if not isinstance(values_data, dict):
+        # Shallow scan: count distinct column-0 keys without building the YAML graph.
+        # The file is not parsed, so syntax errors go unreported in this mode
+        with open(values_file, 'rb') as file:
+            top_level_keys = set(_TOP_LEVEL_KEY_RE.findall(file.read()))
+        
+        if not top_level_keys:
             return False, ["values.yaml should contain a dictionary"], None
         
-        return True, [], values_data
+        return True, [], len(top_level_keys)
     except Exception as e:
         return False, [str(e)], None
 
+def _iter_templates(root):
+    """Yield template file paths under root using os.scandir"""
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and entry.name.endswith(('.yaml', '.yml')) and entry.name != 'NOTES.txt':
+                    yield entry.path
+        # Keep os.walk's top-down ordering
+        stack.extend(reversed(subdirs))
+
 def find_template_files(chart_dir):
     """Find all template files in the chart"""
     templates_dir = os.path.join(chart_dir, 'templates')
     if not os.path.exists(templates_dir):
         return []
     
-    template_files = []
-    for root, dirs, files in os.walk(templates_dir):
-        for file in files:
-            if file.endswith(('.yaml', '.yml')):
-                template_files.append(os.path.join(root, file))
+    return list(_iter_templates(templates_dir))
+
+def validate_template_file(template_file):
+    """Validate one template, printing its status lines and returning failure flags"""
+    file_name = os.path.basename(template_file)
+    
+    # Skip NOTES.txt as it's not a YAML template
+    if file_name == 'NOTES.txt':
+        return False, False
+    
+    # Validate YAML syntax (basic check); Helm templates are not valid YAML until rendered
+    if is_helm_template(template_file):
+        yaml_failed = False
+        print_status("INFO", f"{file_name}: YAML parse skipped (Helm template)")
+    else:
+        yaml_ok, yaml_error = validate_yaml_syntax(template_file)
+        yaml_failed = not yaml_ok and 'found character that cannot start any token' not in str(yaml_error)
+        if yaml_failed:
+            print_status("FAIL", f"{file_name}: YAML syntax error - {yaml_error}")
+        else:
+            print_status("PASS", f"{file_name}: Basic YAML structure OK")
+    
+    # Validate Helm template syntax
+    template_ok, template_issues = validate_helm_template_syntax(template_file)
+    if not template_ok:
+        print_status("FAIL", f"{file_name}: Template issues - {', '.join(template_issues)}")
+    else:
+        print_status("PASS", f"{file_name}: Template syntax OK")
     
-    return template_files
+    return yaml_failed, not template_ok
 
-def check_security_issues(chart_dir):
-    """Check for potential security issues in templates"""
-    template_files = find_template_files(chart_dir)
+def check_security_issues(content, file_name):
+    """Check a template's content for potential security issues"""
     security_issues = []
     
-    for template_file in template_files:
+    # Check for hardcoded secrets, skipping the regex when the word never appears
+    if 'password' in content.lower() and _PASSWORD_RE.search(content):
+        security_issues.append(f"{file_name}: Potential hardcoded password")
+    
+    # Check for privileged containers
+    if 'privileged: true' in content:
+        security_issues.append(f"{file_name}: Privileged container found")
+    
+    # Check for containers running as root
+    if 'runAsUser: 0' in content:
+        security_issues.append(f"{file_name}: Container running as root")
+    
+    return security_issues
+
+def scan_templates(chart_dir):
+    """Walk the templates once, pairing each path with its security issues"""
+    templates = []
+    
+    for template_file in find_template_files(chart_dir):
+        file_name = os.path.basename(template_file)
         try:
-            with open(template_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Check for hardcoded secrets
-            if re.search(r'password:\s*["\']?[^{}\s]+["\']?', content, re.IGNORECASE):
-                security_issues.append(f"{os.path.basename(template_file)}: Potential hardcoded password")
-            
-            # Check for privileged containers
-            if 'privileged: true' in content:
-                security_issues.append(f"{os.path.basename(template_file)}: Privileged container found")
-            
-            # Check for containers running as root
-            if 'runAsUser: 0' in content:
-                security_issues.append(f"{os.path.basename(template_file)}: Container running as root")
-            
+            security_issues = check_security_issues(_read(template_file), file_name)
         except Exception as e:
-            security_issues.append(f"{os.path.basename(template_file)}: Error reading file - {e}")
+            security_issues = [f"{file_name}: Error reading file - {e}"]
+        templates.append((template_file, security_issues))
     
-    return security_issues
+    return templates
 
 def main():
     """Main validation function"""
+    parser = argparse.ArgumentParser(description='Validate Helm chart YAML syntax and structure')
+    parser.add_argument('--shallow', action='store_true', help='Count values.yaml sections with a key scan instead of parsing it (skips syntax validation)')
+    args = parser.parse_args()
+    
     print(f"{Colors.BLUE}=== Helm Chart YAML Validation ==={Colors.NC}")
     
     # Get chart directory
@@ -185,19 +284,24 @@ def main():
     # Check if chart directory exists
     if not os.path.exists(chart_dir):
         print_status("FAIL", f"Chart directory not found: {chart_dir}")
+        flush_status()
         sys.exit(1)
     
+    entries = list_chart_entries(chart_dir)
+    
     # Check required files
     print(f"{Colors.BLUE}=== Checking Required Files ==={Colors.NC}")
-    files_ok, missing_files = check_required_files(chart_dir)
+    files_ok, missing_files = check_required_files(entries)
     
     if files_ok:
         print_status("PASS", "All required files exist")
     else:
         print_status("FAIL", f"Missing required files: {', '.join(missing_files)}")
+        flush_status()
         sys.exit(1)
     
     # Validate Chart.yaml
+    flush_status()
     print(f"\n{Colors.BLUE}=== Validating Chart.yaml ==={Colors.NC}")
     chart_ok, chart_issues, chart_data = validate_chart_yaml(chart_dir)
     
@@ -211,19 +315,22 @@ def main():
         print_status("FAIL", f"Chart.yaml validation failed: {', '.join(chart_issues)}")
     
     # Validate values.yaml
+    flush_status()
     print(f"\n{Colors.BLUE}=== Validating values.yaml ==={Colors.NC}")
-    values_ok, values_issues, values_data = validate_values_yaml(chart_dir)
+    values_ok, values_issues, values_sections = validate_values_yaml(chart_dir, args.shallow)
     
     if values_ok:
-        print_status("PASS", "values.yaml is valid")
-        if values_data:
-            print_status("INFO", f"Found {len(values_data)} top-level configuration sections")
+        print_status("PASS", "values.yaml basic structure OK (YAML parse skipped)" if args.shallow else "values.yaml is valid")
+        if values_sections:
+            print_status("INFO", f"Found {values_sections} top-level configuration sections")
     else:
         print_status("FAIL", f"values.yaml validation failed: {', '.join(values_issues)}")
     
     # Validate template files
+    flush_status()
     print(f"\n{Colors.BLUE}=== Validating Template Files ==={Colors.NC}")
-    template_files = find_template_files(chart_dir)
+    templates = scan_templates(chart_dir)
+    template_files = [template_file for template_file, _ in templates]
     
     if not template_files:
         print_status("WARN", "No template files found")
@@ -234,31 +341,14 @@ def main():
         template_errors = 0
         
         for template_file in template_files:
-            file_name = os.path.basename(template_file)
-            
-            # Skip NOTES.txt as it's not a YAML template
-            if file_name == 'NOTES.txt':
-                continue
-            
-            # Validate YAML syntax (basic check, ignoring Helm templates)
-            yaml_ok, yaml_error = validate_yaml_syntax(template_file)
-            if not yaml_ok and 'found character that cannot start any token' not in str(yaml_error):
-                print_status("FAIL", f"{file_name}: YAML syntax error - {yaml_error}")
-                yaml_errors += 1
-            else:
-                print_status("PASS", f"{file_name}: Basic YAML structure OK")
-            
-            # Validate Helm template syntax
-            template_ok, template_issues = validate_helm_template_syntax(template_file)
-            if not template_ok:
-                print_status("FAIL", f"{file_name}: Template issues - {', '.join(template_issues)}")
-                template_errors += 1
-            else:
-                print_status("PASS", f"{file_name}: Template syntax OK")
+            yaml_failed, template_failed = validate_template_file(template_file)
+            yaml_errors += yaml_failed
+            template_errors += template_failed
     
     # Security checks
+    flush_status()
     print(f"\n{Colors.BLUE}=== Security Checks ==={Colors.NC}")
-    security_issues = check_security_issues(chart_dir)
+    security_issues = [issue for _, issues in templates for issue in issues]
     
     if not security_issues:
         print_status("PASS", "No obvious security issues found")
@@ -267,23 +357,23 @@ def main():
             print_status("WARN", f"Security concern: {issue}")
     
     # Check for best practices
+    flush_status()
     print(f"\n{Colors.BLUE}=== Best Practices Check ==={Colors.NC}")
     
     # Check if .helmignore exists
-    helmignore_path = os.path.join(chart_dir, '.helmignore')
-    if os.path.exists(helmignore_path):
+    if '.helmignore' in entries:
         print_status("PASS", ".helmignore file exists")
     else:
         print_status("WARN", ".helmignore file not found")
     
     # Check if README exists
-    readme_files = glob.glob(os.path.join(chart_dir, 'README*'))
-    if readme_files:
+    if any(name.startswith('README') for name in entries):
         print_status("PASS", "README file exists")
     else:
         print_status("WARN", "README file not found")
     
     # Summary
+    flush_status()
     print(f"\n{Colors.BLUE}=== Validation Summary ==={Colors.NC}")
     
     total_errors = 0
@@ -298,10 +388,12 @@ def main():
     
     if total_errors == 0:
         print_status("PASS", "All validations passed")
+        flush_status()
         print(f"\n{Colors.GREEN}✅ Helm chart validation completed successfully!{Colors.NC}")
         sys.exit(0)
     else:
         print_status("FAIL", f"Found {total_errors} validation errors")
+        flush_status()
         print(f"\n{Colors.RED}❌ Helm chart validation failed!{Colors.NC}")
         sys.exit(1)
 
@@ -5,16 +5,37 @@
 """
 
 import json
+import operator
 import sys
 import argparse
 from typing import Dict, Any, List
 from datetime import datetime
 
+# 优先使用 orjson（可选依赖）处理 JSON，未安装时回退到标准库
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# 指标键名，阈值表、摘要和报告共用
+K_AVG = 'avg_response_time'
+K_P95 = 'p95_response_time'
+K_P99 = 'p99_response_time'
+K_ERR = 'error_rate'
+K_THR = 'throughput'
+
 def analyze_performance_results(results_file: str) -> Dict[str, Any]:
     """分析性能测试结果"""
     try:
-        with open(results_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(results_file, 'rb') as f:
+            data = _loads(f.read())
     except FileNotFoundError:
         print(f"错误: 找不到结果文件 {results_file}")
         sys.exit(1)
@@ -50,11 +71,11 @@ def analyze_performance_results(results_file: str) -> Dict[str, Any]:
     
     # 性能阈值检查
     thresholds = {
-        'avg_response_time': {'value': avg_response_time, 'threshold': 500, 'unit': 'ms'},
-        'p95_response_time': {'value': p95_response_time, 'threshold': 1000, 'unit': 'ms'},
-        'p99_response_time': {'value': p99_response_time, 'threshold': 2000, 'unit': 'ms'},
-        'error_rate': {'value': error_rate, 'threshold': 1, 'unit': '%'},
-        'throughput': {'value': throughput, 'threshold': 100, 'unit': 'req/s'}
+        K_AVG: {'value': avg_response_time, 'threshold': 500, 'unit': 'ms', 'op': operator.le},
+        K_P95: {'value': p95_response_time, 'threshold': 1000, 'unit': 'ms', 'op': operator.le},
+        K_P99: {'value': p99_response_time, 'threshold': 2000, 'unit': 'ms', 'op': operator.le},
+        K_ERR: {'value': error_rate, 'threshold': 1, 'unit': '%', 'op': operator.le},
+        K_THR: {'value': throughput, 'threshold': 100, 'unit': 'req/s', 'op': operator.ge}
     }
     
     # 计算通过/失败状态
@@ -62,10 +83,7 @@ def analyze_performance_results(results_file: str) -> Dict[str, Any]:
     overall_pass = True
     
     for metric, config in thresholds.items():
-        if metric == 'error_rate':
-            passed = config['value'] <= config['threshold']
-        else:
-            passed = config['value'] <= config['threshold'] if metric != 'throughput' else config['value'] >= config['threshold']
+        passed = config['op'](config['value'], config['threshold'])
         
         results[metric] = {
             'value': round(config['value'], 2),
@@ -85,11 +103,11 @@ def analyze_performance_results(results_file: str) -> Dict[str, Any]:
         'total_requests': total_requests,
         'max_vus': max_vus,
         'test_duration': data.get('state', {}).get('testRunDurationMs', 0) / 1000,
-        'avg_response_time': round(avg_response_time, 2),
-        'p95_response_time': round(p95_response_time, 2),
-        'p99_response_time': round(p99_response_time, 2),
-        'error_rate': round(error_rate, 2),
-        'throughput': round(throughput, 2),
+        K_AVG: round(avg_response_time, 2),
+        K_P95: round(p95_response_time, 2),
+        K_P99: round(p99_response_time, 2),
+        K_ERR: round(error_rate, 2),
+        K_THR: round(throughput, 2),
         'data_received': data_received.get('count', 0),
         'data_sent': data_sent.get('count', 0),
         'results': results
@@ -97,47 +115,59 @@ def analyze_performance_results(results_file: str) -> Dict[str, Any]:
     
     return summary
 
-def generate_report(summary: Dict[str, Any]) -> str:
-    """生成性能测试报告"""
-    report = f"""
+# 性能测试报告模板，模块加载时构建一次
+_REPORT_TEMPLATE = """
 # 性能测试报告
 
-**测试时间**: {summary['timestamp']}
-**总体状态**: {'✅ 通过' if summary['overall_status'] == 'pass' else '❌ 失败'}
+**测试时间**: {timestamp}
+**总体状态**: {overall}
 
 ## 测试概览
 
-- **总请求数**: {summary['total_requests']:,}
-- **最大虚拟用户数**: {summary['max_vus']}
-- **测试持续时间**: {summary['test_duration']:.1f} 秒
-- **数据接收**: {summary['data_received']:,} 字节
-- **数据发送**: {summary['data_sent']:,} 字节
+- **总请求数**: {total_requests:,}
+- **最大虚拟用户数**: {max_vus}
+- **测试持续时间**: {test_duration:.1f} 秒
+- **数据接收**: {data_received:,} 字节
+- **数据发送**: {data_sent:,} 字节
 
 ## 性能指标
 
 | 指标 | 值 | 阈值 | 状态 |
 |------|----|----- |------|
-| 平均响应时间 | {summary['avg_response_time']} ms | ≤ {summary['results']['avg_response_time']['threshold']} ms | {summary['results']['avg_response_time']['status']} |
-| 95% 响应时间 | {summary['p95_response_time']} ms | ≤ {summary['results']['p95_response_time']['threshold']} ms | {summary['results']['p95_response_time']['status']} |
-| 99% 响应时间 | {summary['p99_response_time']} ms | ≤ {summary['results']['p99_response_time']['threshold']} ms | {summary['results']['p99_response_time']['status']} |
-| 错误率 | {summary['error_rate']}% | ≤ {summary['results']['error_rate']['threshold']}% | {summary['results']['error_rate']['status']} |
-| 吞吐量 | {summary['throughput']} req/s | ≥ {summary['results']['throughput']['threshold']} req/s | {summary['results']['throughput']['status']} |
+| 平均响应时间 | {avg_response_time} ms | ≤ {avg[threshold]} ms | {avg[status]} |
+| 95% 响应时间 | {p95_response_time} ms | ≤ {p95[threshold]} ms | {p95[status]} |
+| 99% 响应时间 | {p99_response_time} ms | ≤ {p99[threshold]} ms | {p99[status]} |
+| 错误率 | {error_rate}% | ≤ {err[threshold]}% | {err[status]} |
+| 吞吐量 | {throughput} req/s | ≥ {thr[threshold]} req/s | {thr[status]} |
 
 ## 建议
 
 """
+
+def generate_report(summary: Dict[str, Any]) -> str:
+    """生成性能测试报告"""
+    results = summary['results']
+    report = _REPORT_TEMPLATE.format(
+        overall='✅ 通过' if summary['overall_status'] == 'pass' else '❌ 失败',
+        avg=results[K_AVG],
+        p95=results[K_P95],
+        p99=results[K_P99],
+        err=results[K_ERR],
+        thr=results[K_THR],
+        **summary
+    )
     
     # 添加性能建议
-    if summary['avg_response_time'] > 500:
+    if summary[K_AVG] > 500:
         report += "- ⚠️ 平均响应时间较高，建议优化数据库查询和缓存策略\n"
     
-    if summary['error_rate'] > 1:
+    if summary[K_ERR] > 1:
         report += "- ⚠️ 错误率较高，请检查应用日志和错误处理\n"
     
-    if summary['throughput'] < 100:
+    if summary[K_THR] < 100:
         report += "- ⚠️ 吞吐量较低，建议优化应用性能和资源配置\n"
     
-    if summary['p95_response_time'] > 1000:
+    if summary[K_P95] > 1000:
         report += "- ⚠️ 95% 响应时间较高，可能存在性能瓶颈\n"
     
     if summary['overall_status'] == 'pass':
@@ -165,8 +195,8 @@ def main():
         f.write(report)
     
     # 保存 JSON 摘要
-    with open(args.json, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    with open(args.json, 'wb') as f:
+        f.write(_dumps(summary))
     
     # 输出结果
     if args.verbose:
@@ -174,9 +204,9 @@ def main():
     else:
         print(f"性能测试分析完成:")
         print(f"- 总体状态: {'✅ 通过' if summary['overall_status'] == 'pass' else '❌ 失败'}")
-        print(f"- 平均响应时间: {summary['avg_response_time']} ms")
-        print(f"- 错误率: {summary['error_rate']}%")
-        print(f"- 吞吐量: {summary['throughput']} req/s")
+        print(f"- 平均响应时间: {summary[K_AVG]} ms")
+        print(f"- 错误率: {summary[K_ERR]}%")
+        print(f"- 吞吐量: {summary[K_THR]} req/s")
         print(f"- 报告已保存到: {args.output}")
         print(f"- JSON 摘要已保存到: {args.json}")
     
@@ -5,187 +5,398 @@
 """
 
 import json
+import os
 import sys
 import argparse
 import glob
-from typing import Dict, Any, List
+import heapq
+import mmap
+from collections import Counter
+from contextlib import nullcontext
+from itertools import chain, islice, tee
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+# 优先使用 orjson（可选依赖）处理 JSON，未安装时回退到标准库
+try:
+    import orjson
+    _loads = orjson.loads
+    _LOADS_BUFFER = True  # orjson 可直接解析 memoryview
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    _LOADS_BUFFER = False
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# 有 ijson（可选依赖，自动选用 yajl2_c 等 C 后端）时流式解析，避免整份报告驻留内存
+try:
+    import ijson
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
 # 风险等级映射
 RISK_LEVELS = {
-    'High': {'priority': 4, 'emoji': '🔴', 'color': 'red'},
-    'Medium': {'priority': 3, 'emoji': '🟡', 'color': 'yellow'},
-    'Low': {'priority': 2, 'emoji': '🟢', 'color': 'green'},
-    'Informational': {'priority': 1, 'emoji': '🔵', 'color': 'blue'}
+    'High': {
+        'priority': 4, 'emoji': '🔴', 'color': 'red', 'label': '高风险', 'status': '❌ 需要立即修复',
+        'advice': '🚨 **立即修复高风险漏洞**: 发现了高风险安全漏洞，需要立即修复'
+    },
+    'Medium': {
+        'priority': 3, 'emoji': '🟡', 'color': 'yellow', 'label': '中风险', 'status': '⚠️ 建议修复',
+        'advice': '⚠️ **修复中风险漏洞**: 建议在下个版本中修复中风险漏洞'
+    },
+    'Low': {
+        'priority': 2, 'emoji': '🟢', 'color': 'green', 'label': '低风险', 'status': 'ℹ️ 可选修复',
+        'advice': 'ℹ️ **考虑修复低风险漏洞**: 可以在后续版本中考虑修复'
+    },
+    'Informational': {
+        'priority': 1, 'emoji': '🔵', 'color': 'blue', 'label': '信息性', 'status': 'ℹ️ 仅供参考',
+        'advice': None
+    }
 }
 
-def analyze_zap_results(results_files: List[str]) -> Dict[str, Any]:
-    """分析 OWASP ZAP 安全测试结果"""
-    all_alerts = []
-    scan_info = {}
+# 未知风险等级的元数据，模块级共享避免每次查找时分配默认值
+_UNKNOWN_RISK = {'priority': 0, 'emoji': '❓'}
+
+# 风险等级到优先级的映射，解析时直接查整数优先级
+_PRIORITIES = {level: meta['priority'] for level, meta in RISK_LEVELS.items()}
+
+# 摘要中保留的最高风险告警数
+TOP_ALERTS = 20
+
+# 最高优先级，堆中全是该等级时后续告警不可能入选
+_MAX_PRIORITY = max(_PRIORITIES.values())
+
+# 告警中按字符串提取的字段（instances 只记录数量，单独处理）
+_ALERT_KEYS = ('name', 'riskdesc', 'confidence', 'riskcode', 'desc', 'solution', 'reference')
+
+# 风险计数的键，未知等级归入 Unknown
+_RISK_COUNT_KEYS = (*RISK_LEVELS, 'Unknown')
+
+# 告警 instances 数组在 ijson 事件流中的前缀
+_INSTANCES_PREFIX = 'site.item.alerts.item.instances'
+_INSTANCE_ITEM_PREFIX = _INSTANCES_PREFIX + '.item'
+
+# 告警风险描述在 ijson 事件流中的前缀
+_RISKDESC_PREFIX = 'site.item.alerts.item.riskdesc'
+
+# 元素前缀上不代表新元素开始的事件
+_CLOSE_EVENTS = frozenset(('map_key', 'end_map', 'end_array'))
+
+# 超过该大小的结果文件用内存映射交给 orjson 解析，避免整份读入再拷贝
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# 站点级字段在 ijson 事件流中的前缀
+_SITE_KEY_PREFIXES = {
+    'site.item.@name': '@name',
+    'site.item.@host': '@host',
+    'site.item.@port': '@port',
+    'site.item.@ssl': '@ssl'
+}
+
+def _load_document(f) -> Any:
+    """整份解析 JSON 文件，大文件在可用时走内存映射"""
+    if _LOADS_BUFFER and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _loads(view)
+    return _loads(f.read())
+
+def _iter_first_site(f, riskdesc_only=None):
+    """逐个产出第一个站点的告警 ('alert', dict)，最后产出站点信息 ('site', dict)
+
+    流式解析时告警的 instances 数组只计数不构建，以整数代替列表；
+    riskdesc_only() 返回真时，后续告警只提取 riskdesc 字段。
+    第一个站点之后的内容仍会解析完，以便像整份解析一样报告格式错误的文件。
+    """
+    if ijson is None:
+        data = _load_document(f)
+        site = data.get('site', [])
+        if site:
+            site_info = site[0]
+            for alert in site_info.get('alerts', []):
+                yield 'alert', alert
+            yield 'site', site_info
+        return
+
+    sites = 0
+    site_info = {}
+    builder = None
+    instances = None
+    partial = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if partial is not None:
+            # 只需计数的告警，跳过其余字段
+            if prefix == _RISKDESC_PREFIX and event == 'string':
+                partial['riskdesc'] = value
+            elif prefix == 'site.item.alerts.item' and event == 'end_map':
+                yield 'alert', partial
+                partial = None
+        elif builder is not None:
+            # 正在构建单个告警对象
+            if prefix == _INSTANCES_PREFIX:
+                if event == 'start_array':
+                    instances = 0
+                elif event == 'end_array':
+                    builder.event('number', instances)
+                    instances = None
+                else:
+                    builder.event(event, value)
+            elif instances is not None:
+                # 实例数组内部，只统计顶层元素个数
+                if prefix == _INSTANCE_ITEM_PREFIX and event not in _CLOSE_EVENTS:
+                    instances += 1
+            else:
+                builder.event(event, value)
+            if prefix == 'site.item.alerts.item' and event == 'end_map':
+                yield 'alert', builder.value
+                builder = None
+        elif prefix == 'site.item':
+            if event == 'start_map':
+                sites += 1
+            elif event == 'end_map' and sites == 1:
+                # 只分析第一个站点；其余内容照常读完但不处理，截断的文件仍按解析失败处理
+                yield 'site', site_info
+        elif sites == 1:
+            if prefix == 'site.item.alerts.item' and event == 'start_map':
+                if riskdesc_only is not None and riskdesc_only():
+                    partial = {}
+                else:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+            elif prefix in _SITE_KEY_PREFIXES:
+                site_info[_SITE_KEY_PREFIXES[prefix]] = value
+
+def _parse_one(file_path: str) -> Tuple[Optional[str], Optional[Dict[str, Any]], List[Dict[str, Any]], List[int], Counter]:
+    """解析单个 ZAP 结果文件，返回 (警告信息, 扫描信息, 最高风险告警, 告警优先级, 风险计数)"""
+    scan_info = None
+    heap = []
+    seq = 0
+    risk_counts = Counter()
     
-    for file_path in results_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 提取扫描信息
-            site = data.get('site', [])
-            if site:
-                site_info = site[0]
-                scan_info[file_path] = {
-                    'name': site_info.get('@name', ''),
-                    'host': site_info.get('@host', ''),
-                    'port': site_info.get('@port', ''),
-                    'ssl': site_info.get('@ssl', False)
-                }
+    def saturated() -> bool:
+        # 堆满且全是最高等级后，后续告警只需统计风险等级
+        return len(heap) == TOP_ALERTS and heap[0][0] == _MAX_PRIORITY
+    
+    try:
+        with open(file_path, 'rb') as f:
+            for kind, item in _iter_first_site(f, saturated):
+                if kind == 'site':
+                    # 提取扫描信息
+                    scan_info = {
+                        'name': item.get('@name', ''),
+                        'host': item.get('@host', ''),
+                        'port': item.get('@port', ''),
+                        'ssl': item.get('@ssl', False)
+                    }
+                    continue
+                
+                # 解析风险等级，置信度只在最终选中的告警上解析
+                alert = item
+                level, sep, _ = alert.get('riskdesc', '').partition(' - ')
+                risk_level = level if sep else 'Unknown'
+                
+                # 统计风险等级，未知等级在合并时归入 Unknown
+                risk_counts[risk_level] += 1
+                
+                # 堆顶是已保留告警中优先级最低、位置最靠后的一个；
+                # 堆满后优先级不高于它的告警不可能入选，无需构建
+                priority = _PRIORITIES.get(risk_level, 0)
+                seq += 1
+                if len(heap) == TOP_ALERTS and priority <= heap[0][0]:
+                    continue
                 
                 # 提取告警信息
-                alerts = site_info.get('alerts', [])
-                for alert in alerts:
-                    alert_info = {
-                        'file': file_path,
-                        'name': alert.get('name', ''),
-                        'riskdesc': alert.get('riskdesc', ''),
-                        'confidence': alert.get('confidence', ''),
-                        'riskcode': alert.get('riskcode', ''),
-                        'desc': alert.get('desc', ''),
-                        'solution': alert.get('solution', ''),
-                        'reference': alert.get('reference', ''),
-                        'instances': alert.get('instances', [])
-                    }
-                    
-                    # 解析风险等级
-                    risk_desc = alert_info['riskdesc']
-                    if ' - ' in risk_desc:
-                        risk_level = risk_desc.split(' - ')[0]
-                        confidence_level = risk_desc.split(' - ')[1]
-                    else:
-                        risk_level = 'Unknown'
-                        confidence_level = 'Unknown'
-                    
-                    alert_info['risk_level'] = risk_level
-                    alert_info['confidence_level'] = confidence_level
-                    
-                    all_alerts.append(alert_info)
-                    
-        except FileNotFoundError:
-            print(f"警告: 找不到结果文件 {file_path}")
-            continue
-        except json.JSONDecodeError:
-            print(f"警告: 无法解析 JSON 文件 {file_path}")
-            continue
+                alert_info = {'file': file_path, **{key: alert.get(key, '') for key in _ALERT_KEYS}}
+                # 只保留实例数，不保留实例明细
+                instances = alert.get('instances') or ()
+                alert_info['instances_count'] = instances if isinstance(instances, int) else len(instances)
+                alert_info['risk_level'] = risk_level
+                
+                entry = (priority, -seq, alert_info)
+                if len(heap) < TOP_ALERTS:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+    except FileNotFoundError:
+        return f"警告: 找不到结果文件 {file_path}", None, [], [], Counter()
+    except _JSON_ERRORS:
+        return f"警告: 无法解析 JSON 文件 {file_path}", None, [], [], Counter()
     
-    # 统计风险等级
-    risk_counts = {level: 0 for level in RISK_LEVELS.keys()}
-    risk_counts['Unknown'] = 0
+    # 按优先级降序、同等级按原顺序排列
+    top = sorted(heap, reverse=True)
+    return None, scan_info, [entry[2] for entry in top], [entry[0] for entry in top], risk_counts
+
+def analyze_zap_results(results_files: Iterable[str]) -> Dict[str, Any]:
+    """分析 OWASP ZAP 安全测试结果"""
+    candidates = []
+    priorities = []
+    scan_info = {}
+    risk_counts = dict.fromkeys(_RISK_COUNT_KEYS, 0)
     
-    for alert in all_alerts:
-        risk_level = alert['risk_level']
-        if risk_level in risk_counts:
-            risk_counts[risk_level] += 1
-        else:
-            risk_counts['Unknown'] += 1
+    # 多个文件时并行解析，每个进程独立运行 JSON 解码。文件路径可以是惰性序列，
+    # 先取至多 CPU 数个路径确定进程数，其余边产出边提交；逐个合并返回结果，合并后即释放
+    files = iter(results_files)
+    head = list(islice(files, os.cpu_count() or 1))
+    workers = len(head)
+    if workers > 1:
+        # 单文件运行用不到进程池，延迟导入以免增加启动时间
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = nullcontext()
+    with pool as executor:
+        paths, pending = tee(chain(head, files))
+        parsed = executor.map(_parse_one, pending, chunksize=1) if executor else map(_parse_one, pending)
+        for file_path, (warning, file_scan_info, file_alerts, file_priorities, file_counts) in zip(paths, parsed):
+            if warning:
+                print(warning)
+                continue
+            
+            if file_scan_info is not None:
+                scan_info[file_path] = file_scan_info
+            candidates.extend(file_alerts)
+            priorities.extend(file_priorities)
+            for level, count in file_counts.items():
+                risk_counts[level if level in risk_counts else 'Unknown'] += count
     
-    # 按风险等级排序告警
-    sorted_alerts = sorted(all_alerts, key=lambda x: RISK_LEVELS.get(x['risk_level'], {'priority': 0})['priority'], reverse=True)
+    # 每个文件已按原顺序给出各自的前20个，全局前20个必在其中（nlargest 稳定，同等级保持原顺序）
+    top_indexes = heapq.nlargest(TOP_ALERTS, range(len(candidates)), key=priorities.__getitem__)
+    top_alerts = [candidates[i] for i in top_indexes]
+    for alert_info in top_alerts:
+        _, sep, rest = alert_info['riskdesc'].partition(' - ')
+        alert_info['confidence_level'] = rest.partition(' - ')[0] if sep else 'Unknown'
     
     # 生成摘要
     summary = {
         'timestamp': datetime.now().isoformat(),
-        'total_alerts': len(all_alerts),
-        'high_risk_count': risk_counts['High'],
-        'medium_risk_count': risk_counts['Medium'],
-        'low_risk_count': risk_counts['Low'],
-        'info_risk_count': risk_counts['Informational'],
-        'unknown_risk_count': risk_counts['Unknown'],
+        'total_alerts': sum(risk_counts.values()),
         'risk_counts': risk_counts,
         'scan_info': scan_info,
-        'alerts': sorted_alerts[:20],  # 只保留前20个最高风险的告警
+        'alerts': top_alerts,  # 只保留前20个最高风险的告警
         'overall_status': 'fail' if risk_counts['High'] > 0 else 'pass'
     }
     
     return summary
 
-def generate_security_report(summary: Dict[str, Any]) -> str:
-    """生成安全测试报告"""
-    report = f"""
+# 安全测试报告模板，模块加载时构建一次
+_REPORT_HEADER = """
 # 安全测试报告
 
-**测试时间**: {summary['timestamp']}
-**总体状态**: {'❌ 发现高风险漏洞' if summary['overall_status'] == 'fail' else '✅ 未发现高风险漏洞'}
+**测试时间**: {timestamp}
+**总体状态**: {overall}
 
 ## 扫描概览
 
-- **总告警数**: {summary['total_alerts']}
-- **高风险**: {summary['high_risk_count']} 🔴
-- **中风险**: {summary['medium_risk_count']} 🟡
-- **低风险**: {summary['low_risk_count']} 🟢
-- **信息性**: {summary['info_risk_count']} 🔵
-
+- **总告警数**: {total_alerts}
+{overview}
 ## 风险分布
 
 | 风险等级 | 数量 | 状态 |
 |----------|------|------|
-| 🔴 高风险 | {summary['high_risk_count']} | {'❌ 需要立即修复' if summary['high_risk_count'] > 0 else '✅'} |
-| 🟡 中风险 | {summary['medium_risk_count']} | {'⚠️ 建议修复' if summary['medium_risk_count'] > 0 else '✅'} |
-| 🟢 低风险 | {summary['low_risk_count']} | {'ℹ️ 可选修复' if summary['low_risk_count'] > 0 else '✅'} |
-| 🔵 信息性 | {summary['info_risk_count']} | {'ℹ️ 仅供参考' if summary['info_risk_count'] > 0 else '✅'} |
-
+{distribution}
 ## 扫描目标
 
 """
+
+_ALERT_HEADER = """### {index}. {emoji} {name}
+
+**风险等级**: {risk_level}
+**置信度**: {confidence_level}
+"""
+
+_REPORT_FOOTER = """
+## 安全最佳实践
+
+1. **定期安全扫描**: 建议每次发布前进行安全扫描
+2. **及时更新依赖**: 保持第三方库和框架的最新版本
+3. **输入验证**: 对所有用户输入进行严格验证
+4. **访问控制**: 实施最小权限原则
+5. **安全头**: 配置适当的 HTTP 安全头
+6. **日志监控**: 监控异常访问和攻击尝试
+"""
+
+def _trunc(text: str, limit: int = 200) -> str:
+    """超过 limit 个字符的文本截断并追加省略号"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def generate_security_report(summary: Dict[str, Any]) -> str:
+    """生成安全测试报告"""
+    risk_counts = summary['risk_counts']
+    parts = [_REPORT_HEADER.format(
+        overall='❌ 发现高风险漏洞' if summary['overall_status'] == 'fail' else '✅ 未发现高风险漏洞',
+        overview="".join(
+            f"- **{meta['label']}**: {risk_counts[level]} {meta['emoji']}\n"
+            for level, meta in RISK_LEVELS.items()
+        ),
+        distribution="".join(
+            f"| {meta['emoji']} {meta['label']} | {risk_counts[level]} | {meta['status'] if risk_counts[level] > 0 else '✅'} |\n"
+            for level, meta in RISK_LEVELS.items()
+        ),
+        **summary
+    )]
     
     for file_path, info in summary['scan_info'].items():
         protocol = 'https' if info['ssl'] else 'http'
         url = f"{protocol}://{info['host']}:{info['port']}"
-        report += f"- **{info['name']}**: {url}\n"
+        parts.append(f"- **{info['name']}**: {url}\n")
     
     if summary['alerts']:
-        report += "\n## 主要安全问题\n\n"
+        parts.append("\n## 主要安全问题\n\n")
         
         for i, alert in enumerate(summary['alerts'][:10], 1):
-            risk_info = RISK_LEVELS.get(alert['risk_level'], {'emoji': '❓'})
-            report += f"### {i}. {risk_info['emoji']} {alert['name']}\n\n"
-            report += f"**风险等级**: {alert['risk_level']}\n"
-            report += f"**置信度**: {alert['confidence_level']}\n"
-            report += f"**描述**: {alert['desc'][:200]}...\n" if len(alert['desc']) > 200 else f"**描述**: {alert['desc']}\n"
+            risk_info = RISK_LEVELS.get(alert['risk_level'], _UNKNOWN_RISK)
+            parts.append(_ALERT_HEADER.format(index=i, emoji=risk_info['emoji'], **alert))
+            parts.append(f"**描述**: {_trunc(alert['desc'])}\n")
             
             if alert['solution']:
-                report += f"**解决方案**: {alert['solution'][:200]}...\n" if len(alert['solution']) > 200 else f"**解决方案**: {alert['solution']}\n"
+                parts.append(f"**解决方案**: {_trunc(alert['solution'])}\n")
             
-            if alert['instances']:
-                report += f"**影响实例数**: {len(alert['instances'])}\n"
+            if alert['instances_count']:
+                parts.append(f"**影响实例数**: {alert['instances_count']}\n")
             
-            report += "\n---\n\n"
+            parts.append("\n---\n\n")
     
     # 添加安全建议
-    report += "## 安全建议\n\n"
-    
-    if summary['high_risk_count'] > 0:
-        report += "- 🚨 **立即修复高风险漏洞**: 发现了高风险安全漏洞，需要立即修复\n"
+    parts.append("## 安全建议\n\n")
     
-    if summary['medium_risk_count'] > 0:
-        report += "- ⚠️ **修复中风险漏洞**: 建议在下个版本中修复中风险漏洞\n"
-    
-    if summary['low_risk_count'] > 0:
-        report += "- ℹ️ **考虑修复低风险漏洞**: 可以在后续版本中考虑修复\n"
+    for level, meta in RISK_LEVELS.items():
+        if meta['advice'] and risk_counts[level] > 0:
+            parts.append(f"- {meta['advice']}\n")
     
     if summary['total_alerts'] == 0:
-        report += "- ✅ **安全状况良好**: 未发现明显的安全漏洞\n"
+        parts.append("- ✅ **安全状况良好**: 未发现明显的安全漏洞\n")
     
-    report += """
-## 安全最佳实践
-
-1. **定期安全扫描**: 建议每次发布前进行安全扫描
-2. **及时更新依赖**: 保持第三方库和框架的最新版本
-3. **输入验证**: 对所有用户输入进行严格验证
-4. **访问控制**: 实施最小权限原则
-5. **安全头**: 配置适当的 HTTP 安全头
-6. **日志监控**: 监控异常访问和攻击尝试
-"""
+    parts.append(_REPORT_FOOTER)
     
-    return report
+    return "".join(parts)
+
+def _expand(patterns: Iterable[str]) -> Iterator[str]:
+    """逐个展开通配符，不含通配符的普通路径无需访问文件系统"""
+    for pattern in patterns:
+        if not glob.has_magic(pattern):
+            yield pattern
+            continue
+        
+        matched = False
+        for path in glob.iglob(pattern):
+            matched = True
+            yield path
+        if not matched:
+            yield pattern  # 如果没有匹配，保留原始路径
+
+def _write_report(path: str, report: str) -> None:
+    """保存 Markdown 报告"""
+    Path(path).write_text(report, encoding='utf-8')
+
+def _write_summary(path: str, summary: Dict[str, Any]) -> None:
+    """序列化并保存 JSON 摘要"""
+    Path(path).write_bytes(_dumps(summary))
 
 def main():
     parser = argparse.ArgumentParser(description='分析 OWASP ZAP 安全测试结果')
@@ -197,28 +408,17 @@ def main():
     
     args = parser.parse_args()
     
-    # 展开通配符
-    all_files = []
-    for pattern in args.results_files:
-        files = glob.glob(pattern)
-        if files:
-            all_files.extend(files)
-        else:
-            all_files.append(pattern)  # 如果没有匹配，保留原始路径
-    
-    # 分析结果
-    summary = analyze_zap_results(all_files)
+    # 分析结果，通配符边展开边解析
+    summary = analyze_zap_results(_expand(args.results_files))
     
     # 生成报告
     report = generate_security_report(summary)
     
     # 保存报告
-    with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(report)
+    _write_report(args.output, report)
     
     # 保存 JSON 摘要
-    with open(args.json, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    _write_summary(args.json, summary)
     
     # 输出结果
     if args.verbose:
@@ -226,16 +426,15 @@ def main():
     else:
         print(f"安全测试分析完成:")
         print(f"- 总告警数: {summary['total_alerts']}")
-        print(f"- 高风险: {summary['high_risk_count']} 🔴")
-        print(f"- 中风险: {summary['medium_risk_count']} 🟡")
-        print(f"- 低风险: {summary['low_risk_count']} 🟢")
-        print(f"- 信息性: {summary['info_risk_count']} 🔵")
+        for level, meta in RISK_LEVELS.items():
+            print(f"- {meta['label']}: {summary['risk_counts'][level]} {meta['emoji']}")
         print(f"- 报告已保存到: {args.output}")
         print(f"- JSON 摘要已保存到: {args.json}")
     
     # 如果发现高风险漏洞且设置了 fail-on-high，退出码为 1
-    if args.fail_on_high and summary['high_risk_count'] > 0:
-        print(f"❌ 发现 {summary['high_risk_count']} 个高风险漏洞，测试失败")
+    high_risk_count = summary['risk_counts']['High']
+    if args.fail_on_high and high_risk_count > 0:
+        print(f"❌ 发现 {high_risk_count} 个高风险漏洞，测试失败")
         sys.exit(1)
 
 if __name__ == '__main__':